@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict
+import sys
+from collections.abc import Mapping
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, TypeVar, cast
 
 if TYPE_CHECKING:
     from typing_extensions import Self, Unpack
@@ -68,6 +72,64 @@ class ChannelMixOptions(TypedDict):
     right_to_right: float | None
 
 
+_PayloadT = TypeVar("_PayloadT", bound=Mapping[str, object])
+
+
+def _interned(payload: _PayloadT) -> _PayloadT:
+    # Filters keep their own copy of a payload so outside edits cannot bypass the cached Filters payload.
+    # Decoded JSON keys are not interned, unlike the literal keys written by each filter's ``set``.
+    return cast(_PayloadT, {sys.intern(key): value for key, value in payload.items()})
+
+
+def _update(payload: Mapping[str, object], options: Mapping[str, object], keys: Mapping[str, str] | None = None) -> None:
+    # Writes each provided option that is not None, renaming options to payload keys through ``keys`` when given.
+    target = cast("dict[str, object]", payload)
+
+    for key, value in options.items():
+        if value is None:
+            continue
+
+        if keys is not None:
+            if key not in keys:
+                continue
+
+            key = keys[key]
+
+        target[key] = value
+
+
+_KARAOKE_KEYS: dict[str, str] = {
+    "level": "level",
+    "mono_level": "monoLevel",
+    "filter_band": "filterBand",
+    "filter_width": "filterWidth",
+}
+
+_DISTORTION_KEYS: dict[str, str] = {
+    "sin_offset": "sinOffset",
+    "sin_scale": "sinScale",
+    "cos_offset": "cosOffset",
+    "cos_scale": "cosScale",
+    "tan_offset": "tanOffset",
+    "tan_scale": "tanScale",
+    "offset": "offset",
+    "scale": "scale",
+}
+
+_CHANNEL_MIX_KEYS: dict[str, str] = {
+    "left_to_left": "leftToLeft",
+    "left_to_right": "leftToRight",
+    "right_to_left": "rightToLeft",
+    "right_to_right": "rightToRight",
+}
+
+
+# Bands are stored read-only, so the default layout can be shared by every Equalizer that has not been given bands.
+_DEFAULT_EQ: Mapping[int, Mapping[str, float]] = MappingProxyType(
+    {n: MappingProxyType({"band": n, "gain": 0.0}) for n in range(15)}
+)
+
+
 class Equalizer:
     """Equalizer Filter Class.
 
@@ -80,26 +142,44 @@ class Equalizer:
     Modifying the ``gain`` could also change the volume of the output.
     """
 
+    __slots__ = ("_payload", "_owned", "_version", "__weakref__")
+
     def __init__(self, payload: list[EqualizerPayload] | None = None) -> None:
-        if payload and len(payload) == 15:
+        self._payload: Mapping[int, Mapping[str, float]]
+        self._owned: bool
+        self._version: int = 0
+
+        if payload:
             self._payload = self._set(payload)
+            self._owned = True
 
         else:
-            payload_: dict[int, EqualizerPayload] = {n: {"band": n, "gain": 0.0} for n in range(15)}
-            self._payload = payload_
+            self._payload = _DEFAULT_EQ
+            self._owned = False
 
     @classmethod
-    def _set(cls, payload: list[EqualizerPayload]) -> dict[int, EqualizerPayload]:
-        default: dict[int, EqualizerPayload] = {n: {"band": n, "gain": 0.0} for n in range(15)}
+    def _set(cls, payload: list[EqualizerPayload]) -> dict[int, Mapping[str, float]]:
+        bands: dict[int, Mapping[str, float]] = {}
 
         for eq in payload:
             band: int = eq["band"]
             if band > 14 or band < 0:
                 continue
 
-            default[band] = eq
+            bands[band] = MappingProxyType({"band": band, "gain": eq["gain"]})
 
-        return default
+        # Bands that were not provided keep the shared defaults.
+        if len(bands) == 15:
+            return bands
+
+        return {n: bands.get(n, default) for n, default in _DEFAULT_EQ.items()}
+
+    def bands(self) -> list[EqualizerPayload]:
+        """Return a copy of every band as a ``list`` of ``dict``, ordered as stored.
+
+        The returned bands can be modified and passed back to :meth:`~Equalizer.set`.
+        """
+        return [{"band": n, "gain": band["gain"]} for n, band in self._payload.items()]
 
     def set(self, **options: Unpack[EqualizerOptions]) -> Self:
         """Set the bands of the Equalizer class.
@@ -111,36 +191,46 @@ class Equalizer:
         and ``0.25`` means it will be doubled.
 
         Using this method changes **all** bands, resetting any bands not provided.
-        To change specific bands, consider accessing :attr:`~Equalizer.payload` first.
+        To change specific bands, consider using :meth:`~Equalizer.bands` first.
         """
-        default: dict[int, EqualizerPayload] = {n: {"band": n, "gain": 0.0} for n in range(15)}
         payload: list[EqualizerPayload] | None = options.get("bands", None)
 
         if payload is None:
-            self._payload = default
-            return self
+            return self.reset()
 
         self._payload = self._set(payload)
+        self._owned = True
+        self._version += 1
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
-        self._payload: dict[int, EqualizerPayload] = {n: {"band": n, "gain": 0.0} for n in range(15)}
+        self._payload = _DEFAULT_EQ
+        self._owned = False
+        self._version += 1
         return self
 
     @property
-    def payload(self) -> dict[int, EqualizerPayload]:
+    def payload(self) -> Mapping[int, Mapping[str, float]]:
         """The raw payload associated with this filter.
 
-        This property returns a copy.
+        This property returns a read-only view, and each band is read-only.
+        See :meth:`~Equalizer.bands` for a mutable copy.
         """
-        return self._payload.copy()
+        if not self._owned:
+            return self._payload
+
+        return MappingProxyType(self._payload)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[list[EqualizerPayload] | None]]:
+        # The read-only band views cannot be pickled, so rebuild from plain bands instead.
+        return (type(self), (self.bands() if self._owned else None,))
 
     def __str__(self) -> str:
         return "Equalizer"
 
     def __repr__(self) -> str:
-        return f"<Equalizer: {self._payload}>"
+        return f"<Equalizer: { {n: dict(band) for n, band in self._payload.items()} }>"
 
 
 class Karaoke:
@@ -149,8 +239,11 @@ class Karaoke:
     Uses equalization to eliminate part of a band, usually targeting vocals.
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: KaraokePayload) -> None:
-        self._payload = payload
+        self._payload: KaraokePayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[KaraokeOptions]) -> Self:
         """Set the properties of the this filter.
@@ -170,17 +263,16 @@ class Karaoke:
             filter_width: Optional[float]
                 The filter width.
         """
-        self._payload: KaraokePayload = {
-            "level": options.get("level", self._payload.get("level")),
-            "monoLevel": options.get("mono_level", self._payload.get("monoLevel")),
-            "filterBand": options.get("filter_band", self._payload.get("filterBand")),
-            "filterWidth": options.get("filter_width", self._payload.get("filterWidth")),
-        }
+        if options:
+            _update(self._payload, options, _KARAOKE_KEYS)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: KaraokePayload = {}
+        self._version += 1
         return self
 
     @property
@@ -204,8 +296,11 @@ class Timescale:
     Changes the speed, pitch, and rate.
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: TimescalePayload) -> None:
-        self._payload = payload
+        self._payload: TimescalePayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[TimescalePayload]) -> Self:
         """Set the properties of the this filter.
@@ -223,12 +318,16 @@ class Timescale:
             rate: Optional[float]
                 The rate.
         """
-        self._payload.update(options)
+        if options:
+            _update(self._payload, options)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: TimescalePayload = {}
+        self._version += 1
         return self
 
     @property
@@ -253,8 +352,11 @@ class Tremolo:
     Demo: https://en.wikipedia.org/wiki/File:Fuse_Electronics_Tremolo_MK-III_Quick_Demo.ogv
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: TremoloPayload) -> None:
-        self._payload = payload
+        self._payload: TremoloPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[TremoloPayload]) -> Self:
         """Set the properties of the this filter.
@@ -270,12 +372,16 @@ class Tremolo:
             depth: Optional[float]
                 The tremolo depth.
         """
-        self._payload.update(options)
+        if options:
+            _update(self._payload, options)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: TremoloPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -299,8 +405,11 @@ class Vibrato:
     Similar to tremolo. While tremolo oscillates the volume, vibrato oscillates the pitch.
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: VibratoPayload) -> None:
-        self._payload = payload
+        self._payload: VibratoPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[VibratoPayload]) -> Self:
         """Set the properties of the this filter.
@@ -316,12 +425,16 @@ class Vibrato:
             depth: Optional[float]
                 The vibrato depth.
         """
-        self._payload.update(options)
+        if options:
+            _update(self._payload, options)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: VibratoPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -346,8 +459,11 @@ class Rotation:
     It can produce an effect similar to https://youtu.be/QB9EB8mTKcc (without the reverb).
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: RotationPayload) -> None:
-        self._payload = payload
+        self._payload: RotationPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[RotationOptions]) -> Self:
         """Set the properties of the this filter.
@@ -361,12 +477,19 @@ class Rotation:
             rotation_hz: Optional[float]
                 The frequency of the audio rotating around the listener in Hz. ``0.2`` is similar to the example video.
         """
-        self._payload: RotationPayload = {"rotationHz": options.get("rotation_hz", self._payload.get("rotationHz"))}
+        if options:
+            rotation_hz: float | None = options.get("rotation_hz")
+            if rotation_hz is not None:
+                self._payload["rotationHz"] = rotation_hz
+
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: RotationPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -390,8 +513,11 @@ class Distortion:
     According to Lavalink "It can generate some pretty unique audio effects."
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: DistortionPayload) -> None:
-        self._payload = payload
+        self._payload: DistortionPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[DistortionPayload]) -> Self:
         """Set the properties of the this filter.
@@ -419,21 +545,16 @@ class Distortion:
             scale: Optional[float]
                 The scale.
         """
-        self._payload: DistortionPayload = {
-            "sinOffset": options.get("sin_offset", self._payload.get("sinOffset")),
-            "sinScale": options.get("sin_scale", self._payload.get("sinScale")),
-            "cosOffset": options.get("cos_offset", self._payload.get("cosOffset")),
-            "cosScale": options.get("cos_scale", self._payload.get("cosScale")),
-            "tanOffset": options.get("tan_offset", self._payload.get("tanOffset")),
-            "tanScale": options.get("tan_scale", self._payload.get("tanScale")),
-            "offset": options.get("offset", self._payload.get("offset")),
-            "scale": options.get("scale", self._payload.get("scale")),
-        }
+        if options:
+            _update(self._payload, options, _DISTORTION_KEYS)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: DistortionPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -460,8 +581,11 @@ class ChannelMix:
     Setting all factors to ``0.5`` means both channels get the same audio.
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: ChannelMixPayload) -> None:
-        self._payload = payload
+        self._payload: ChannelMixPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[ChannelMixOptions]) -> Self:
         """Set the properties of the this filter.
@@ -481,17 +605,16 @@ class ChannelMix:
             right_to_right: Optional[float]
                 The right to right channel mix factor. Between ``0.0`` and ``1.0``.
         """
-        self._payload: ChannelMixPayload = {
-            "leftToLeft": options.get("left_to_left", self._payload.get("leftToLeft")),
-            "leftToRight": options.get("left_to_right", self._payload.get("leftToRight")),
-            "rightToLeft": options.get("right_to_left", self._payload.get("rightToLeft")),
-            "rightToRight": options.get("right_to_right", self._payload.get("rightToRight")),
-        }
+        if options:
+            _update(self._payload, options, _CHANNEL_MIX_KEYS)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: ChannelMixPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -516,8 +639,11 @@ class LowPass:
     Any smoothing values equal to or less than ``1.0`` will disable the filter.
     """
 
+    __slots__ = ("_payload", "_version", "__weakref__")
+
     def __init__(self, payload: LowPassPayload) -> None:
-        self._payload = payload
+        self._payload: LowPassPayload = _interned(payload)
+        self._version: int = 0
 
     def set(self, **options: Unpack[LowPassPayload]) -> Self:
         """Set the properties of the this filter.
@@ -531,12 +657,16 @@ class LowPass:
             smoothing: Optional[float]
                 The smoothing factor.
         """
-        self._payload.update(options)
+        if options:
+            _update(self._payload, options)
+            self._version += 1
+
         return self
 
     def reset(self) -> Self:
         """Reset this filter to its defaults."""
         self._payload: LowPassPayload = {}
+        self._version += 1
         return self
 
     @property
@@ -554,6 +684,24 @@ class LowPass:
         return f"<LowPass: {self._payload}>"
 
 
+_PayloadFilter: TypeAlias = Karaoke | Timescale | Tremolo | Vibrato | Rotation | Distortion | ChannelMix | LowPass
+
+# (option name, attribute, payload key, class) for every filter that wraps a plain payload dict.
+# Volume and the Equalizer are handled separately, since neither follows that shape.
+_FILTER_FIELDS: tuple[tuple[str, str, str, type[_PayloadFilter]], ...] = (
+    ("karaoke", "_karaoke", "karaoke", Karaoke),
+    ("timescale", "_timescale", "timescale", Timescale),
+    ("tremolo", "_tremolo", "tremolo", Tremolo),
+    ("vibrato", "_vibrato", "vibrato", Vibrato),
+    ("rotation", "_rotation", "rotation", Rotation),
+    ("distortion", "_distortion", "distortion", Distortion),
+    ("channel_mix", "_channel_mix", "channelMix", ChannelMix),
+    ("low_pass", "_low_pass", "lowPass", LowPass),
+)
+
+_filter_versions = attrgetter("_equalizer._version", *(f"{attr}._version" for _, attr, _, _ in _FILTER_FIELDS))
+
+
 class Filters:
     """The Filters class.
 
@@ -574,44 +722,69 @@ class Filters:
     To retrieve the ``payload`` for this Filters class, you can call an instance of this class.
     """
 
+    __slots__ = (
+        "_volume",
+        "_equalizer",
+        *(attr for _, attr, _, _ in _FILTER_FIELDS),
+        "_cached_payload",
+        "_cached_versions",
+        "__weakref__",
+    )
+
+    # Slot types for type checkers; the slots themselves are filled from _FILTER_FIELDS.
+    _volume: float | None
+    _equalizer: Equalizer
+    _karaoke: Karaoke
+    _timescale: Timescale
+    _tremolo: Tremolo
+    _vibrato: Vibrato
+    _rotation: Rotation
+    _distortion: Distortion
+    _channel_mix: ChannelMix
+    _low_pass: LowPass
+
     def __init__(self, *, data: FilterPayload | None = None) -> None:
-        self._volume: float | None = None
-        self._equalizer: Equalizer = Equalizer(None)
-        self._karaoke: Karaoke = Karaoke({})
-        self._timescale: Timescale = Timescale({})
-        self._tremolo: Tremolo = Tremolo({})
-        self._vibrato: Vibrato = Vibrato({})
-        self._rotation: Rotation = Rotation({})
-        self._distortion: Distortion = Distortion({})
-        self._channel_mix: ChannelMix = ChannelMix({})
-        self._low_pass: LowPass = LowPass({})
+        self._cached_payload: FilterPayload | None
+        self._cached_versions: tuple[int, ...] = ()
+
+        self._reset()
 
         if data:
             self._create_from(data)
 
+    def _invalidate(self) -> None:
+        self._cached_payload = None
+
     def _create_from(self, data: FilterPayload) -> None:
         self._volume = data.get("volume")
         self._equalizer = Equalizer(data.get("equalizer", None))
-        self._karaoke = Karaoke(data.get("karaoke", {}))
-        self._timescale = Timescale(data.get("timescale", {}))
-        self._tremolo = Tremolo(data.get("tremolo", {}))
-        self._vibrato = Vibrato(data.get("vibrato", {}))
-        self._rotation = Rotation(data.get("rotation", {}))
-        self._distortion = Distortion(data.get("distortion", {}))
-        self._channel_mix = ChannelMix(data.get("channelMix", {}))
-        self._low_pass = LowPass(data.get("lowPass", {}))
+
+        payloads = cast("Mapping[str, Any]", data)
+        for _, attr, key, cls in _FILTER_FIELDS:
+            setattr(self, attr, cls(payloads.get(key, {})))
+
+        self._invalidate()
 
     def _set_with_reset(self, filters: FiltersOptions) -> None:
-        self._volume = filters.get("volume")
-        self._equalizer = filters.get("equalizer", Equalizer(None))
-        self._karaoke = filters.get("karaoke", Karaoke({}))
-        self._timescale = filters.get("timescale", Timescale({}))
-        self._tremolo = filters.get("tremolo", Tremolo({}))
-        self._vibrato = filters.get("vibrato", Vibrato({}))
-        self._rotation = filters.get("rotation", Rotation({}))
-        self._distortion = filters.get("distortion", Distortion({}))
-        self._channel_mix = filters.get("channel_mix", ChannelMix({}))
-        self._low_pass = filters.get("low_pass", LowPass({}))
+        self._reset()
+        self._set_from(filters)
+
+    def _set_from(self, filters: FiltersOptions) -> None:
+        # An explicit ``volume=None`` clears the volume, unlike the filter options below.
+        if "volume" in filters:
+            self._volume = filters["volume"]
+
+        equalizer: Equalizer | None = filters.get("equalizer")
+        if equalizer is not None:
+            self._equalizer = equalizer
+
+        options = cast("Mapping[str, object]", filters)
+        for key, attr, _, _ in _FILTER_FIELDS:
+            value = options.get(key)
+            if value is not None:
+                setattr(self, attr, value)
+
+        self._invalidate()
 
     def set_filters(self, **filters: Unpack[FiltersOptions]) -> None:
         reset: bool = filters.get("reset", False)
@@ -619,28 +792,16 @@ class Filters:
             self._set_with_reset(filters)
             return
 
-        self._volume = filters.get("volume", self._volume)
-        self._equalizer = filters.get("equalizer", self._equalizer)
-        self._karaoke = filters.get("karaoke", self._karaoke)
-        self._timescale = filters.get("timescale", self._timescale)
-        self._tremolo = filters.get("tremolo", self._tremolo)
-        self._vibrato = filters.get("vibrato", self._vibrato)
-        self._rotation = filters.get("rotation", self._rotation)
-        self._distortion = filters.get("distortion", self._distortion)
-        self._channel_mix = filters.get("channelMix", self._channel_mix)
-        self._low_pass = filters.get("lowPass", self._low_pass)
+        self._set_from(filters)
 
     def _reset(self) -> None:
         self._volume = None
         self._equalizer = Equalizer(None)
-        self._karaoke = Karaoke({})
-        self._timescale = Timescale({})
-        self._tremolo = Tremolo({})
-        self._vibrato = Vibrato({})
-        self._rotation = Rotation({})
-        self._distortion = Distortion({})
-        self._channel_mix = ChannelMix({})
-        self._low_pass = LowPass({})
+
+        for _, attr, _, cls in _FILTER_FIELDS:
+            setattr(self, attr, cls({}))
+
+        self._invalidate()
 
     def reset(self) -> None:
         """Method which resets this object to an original state.
@@ -667,6 +828,7 @@ class Filters:
     @volume.setter
     def volume(self, value: float) -> None:
         self._volume = value
+        self._invalidate()
 
     @property
     def equalizer(self) -> Equalizer:
@@ -714,23 +876,28 @@ class Filters:
         return self._low_pass
 
     def __call__(self) -> FilterPayload:
-        payload: FilterPayload = {
-            "volume": self._volume,
-            "equalizer": list(self._equalizer._payload.values()),
-            "karaoke": self._karaoke._payload,
-            "timescale": self._timescale._payload,
-            "tremolo": self._tremolo._payload,
-            "vibrato": self._vibrato._payload,
-            "rotation": self._rotation._payload,
-            "distortion": self._distortion._payload,
-            "channelMix": self._channel_mix._payload,
-            "lowPass": self._low_pass._payload,
-        }
-
-        for key, value in payload.copy().items():
-            if not value:
-                del payload[key]
-
+        # Individual filters are mutated in place, so their versions are checked alongside the cached payload.
+        # Callers get a shallow copy with their own equalizer bands, so editing the result does not change the cache.
+        versions: tuple[int, ...] = _filter_versions(self)
+        if self._cached_payload is not None and versions == self._cached_versions:
+            payload: FilterPayload = self._cached_payload.copy()
+            payload["equalizer"] = self._equalizer.bands()
+            return payload
+
+        payload = {}
+
+        if self._volume is not None:
+            payload["volume"] = self._volume
+        payload["equalizer"] = self._equalizer.bands()
+
+        payloads = cast("dict[str, object]", payload)
+        for _, attr, key, _ in _FILTER_FIELDS:
+            filter_payload: Mapping[str, object] = getattr(self, attr)._payload
+            if filter_payload:
+                payloads[key] = filter_payload
+
+        self._cached_payload = payload.copy()
+        self._cached_versions = versions
         return payload
 
     def __repr__(self) -> str:
@@ -0,0 +1,157 @@
+import copy
+import pickle
+import weakref
+
+import pytest
+
+from lavaMase.filters import ChannelMix, Distortion, Equalizer, Filters, Karaoke, LowPass, Rotation, Timescale
+
+
+def test_equalizer_defaults() -> None:
+    payload = Filters()()
+
+    assert payload == {"equalizer": [{"band": n, "gain": 0.0} for n in range(15)]}
+
+
+def test_equalizer_partial_bands_are_kept() -> None:
+    eq = Equalizer([{"band": 3, "gain": 0.5}, {"band": 20, "gain": 1.0}])
+
+    assert len(eq.payload) == 15
+    assert eq.payload[3]["gain"] == 0.5
+    assert eq.payload[4]["gain"] == 0.0
+
+
+def test_equalizer_duplicate_bands_fill_gaps() -> None:
+    bands = [{"band": n, "gain": 0.1} for n in range(14)] + [{"band": 0, "gain": 0.2}]
+    eq = Equalizer(bands)
+
+    assert sorted(eq.payload) == list(range(15))
+    assert eq.payload[0]["gain"] == 0.2
+    assert eq.payload[14]["gain"] == 0.0
+
+
+def test_equalizer_payload_is_read_only() -> None:
+    for eq in (Equalizer(), Equalizer([{"band": 3, "gain": 0.5}])):
+        with pytest.raises(TypeError):
+            eq.payload[0]["gain"] = 1.0  # type: ignore
+
+        bands = eq.bands()
+        bands[0]["gain"] = 1.0
+        assert eq.payload[0]["gain"] == 0.0
+
+    assert Equalizer().payload[0]["gain"] == 0.0
+
+
+def test_equalizer_set_from_bands() -> None:
+    eq = Equalizer()
+    bands = eq.bands()
+    bands[2]["gain"] = 0.25
+
+    filters = Filters()
+    filters.set_filters(equalizer=eq.set(bands=bands))
+
+    assert filters()["equalizer"][2] == {"band": 2, "gain": 0.25}
+
+
+def test_filters_deepcopy_and_pickle() -> None:
+    default = Filters()
+    custom = Filters()
+    custom.set_filters(equalizer=Equalizer([{"band": 3, "gain": 0.5}]), timescale=Timescale({"speed": 1.2}))
+
+    for filters in (default, custom):
+        assert copy.deepcopy(filters)() == filters()
+        assert pickle.loads(pickle.dumps(filters))() == filters()
+
+
+def test_set_skips_none() -> None:
+    timescale = Timescale({"speed": 1.2}).set(speed=None, pitch=2.0)
+    karaoke = Karaoke({}).set(level=None, mono_level=0.5)
+    distortion = Distortion({"scale": 1.0}).set(scale=None)
+    rotation = Rotation({"rotationHz": 0.2}).set(rotation_hz=None)
+    channel_mix = ChannelMix({}).set(left_to_left=0.5, right_to_right=None)
+
+    assert timescale.payload == {"speed": 1.2, "pitch": 2.0}
+    assert karaoke.payload == {"monoLevel": 0.5}
+    assert distortion.payload == {"scale": 1.0}
+    assert rotation.payload == {"rotationHz": 0.2}
+    assert channel_mix.payload == {"leftToLeft": 0.5}
+
+
+def test_zero_volume_is_sent() -> None:
+    filters = Filters()
+    filters.volume = 0.0
+
+    assert filters()["volume"] == 0.0
+
+
+def test_filters_support_weakrefs() -> None:
+    filters = Filters()
+
+    assert weakref.ref(filters)() is filters
+    assert weakref.ref(filters.equalizer)() is filters.equalizer
+    assert weakref.ref(filters.timescale)() is filters.timescale
+
+
+def test_filters_payload_cache_is_invalidated() -> None:
+    filters = Filters()
+    assert "timescale" not in filters()
+
+    filters.timescale.set(speed=1.5)
+    assert filters()["timescale"] == {"speed": 1.5}
+
+    filters.timescale.reset()
+    assert "timescale" not in filters()
+
+    filters.volume = 0.5
+    assert filters()["volume"] == 0.5
+
+    filters.set_filters(karaoke=Karaoke({"level": 1.0}))
+    assert filters()["karaoke"] == {"level": 1.0}
+
+    filters.equalizer.set(bands=[{"band": 1, "gain": 0.3}])
+    assert filters()["equalizer"][1] == {"band": 1, "gain": 0.3}
+
+    filters.reset()
+    assert filters() == Filters()()
+
+
+def test_filters_payload_cache_is_not_shared_with_callers() -> None:
+    filters = Filters()
+
+    payload = filters()
+    payload["volume"] = 3.0
+    payload["equalizer"].append({"band": 15, "gain": 1.0})
+    payload["equalizer"][0]["gain"] = 1.0
+
+    assert filters() == {"equalizer": [{"band": n, "gain": 0.0} for n in range(15)]}
+    assert filters.volume is None
+
+
+def test_filter_payloads_are_copied_on_construction() -> None:
+    data = {}
+    filters = Filters()
+    filters.set_filters(timescale=Timescale(data))
+    filters()
+
+    data["speed"] = 2.0
+    assert filters.timescale.payload == {}
+    assert "timescale" not in filters()
+
+
+def test_set_filters_channel_mix_and_low_pass() -> None:
+    filters = Filters()
+    filters.set_filters(channel_mix=ChannelMix({"leftToLeft": 0.5}), low_pass=LowPass({"smoothing": 20.0}))
+
+    payload = filters()
+    assert payload["channelMix"] == {"leftToLeft": 0.5}
+    assert payload["lowPass"] == {"smoothing": 20.0}
+
+
+def test_set_filters_volume_none_clears_volume() -> None:
+    filters = Filters()
+    filters.set_filters(volume=0.5, timescale=Timescale({"speed": 1.2}))
+
+    filters.set_filters(volume=None)  # type: ignore
+    assert filters.volume is None
+    assert "volume" not in filters()
+    assert filters()["timescale"] == {"speed": 1.2}